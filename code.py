@@ -1,38 +1,109 @@
 import json
 import logging
+import mmap
+import os
+import stat
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable
+from enum import IntEnum
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it the catalog is parsed in one go
+    ijson = None
+
+# errors raised by the available parsers for malformed catalog files
+JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError,)
+if ijson:
+    JSON_DECODE_ERRORS += (ijson.JSONError,)
+
 # -------------------- Logging Configuration -------------------- #
 LOG_FILE = "library.log"
 
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
-)
+logger = logging.getLogger(__name__)
+
+
+def setup_logging() -> None:
+    """
+    Send log records to the log file. Called from main() so importing this module
+    has no logging side effects.
+    """
+    logging.basicConfig(
+        filename=LOG_FILE,
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s"
+    )
 
 # -------------------- Book Class -------------------- #
+def _is_padded(value: str) -> bool:
+    """
+    Check whether a string starts or ends with whitespace that strip() would remove.
+    """
+    return value[:1].isspace() or value[-1:].isspace()
+
+
+class Status(IntEnum):
+    """
+    Availability of a book. Stored as an integer; mapped to text only at the JSON boundary.
+    """
+
+    AVAILABLE = 0
+    ISSUED = 1
+
+
+# status text as written to the catalog file and shown to the user, indexed by Status
+STATUS_NAMES = ("available", "issued")
+STATUS_LABELS = ("Available", "Issued")
+STATUS_BY_NAME = {name: Status(value) for value, name in enumerate(STATUS_NAMES)}
+
+
 class Book:
     """
     Represents a single book in the library.
     """
 
-    def __init__(self, title: str, author: str, isbn: str, status: str = "available"):
-        self.title = title.strip()
-        self.author = author.strip()
-        self.isbn = isbn.strip()
-        # normalize status
-        if status.lower() not in ("available", "issued"):
-            status = "available"
-        self.status = status.lower()
+    __slots__ = ("title", "author", "isbn", "status", "_title_lower", "_repr")
+
+    def __init__(
+        self,
+        title: str,
+        author: str,
+        isbn: str,
+        status: str = "available",
+        *,
+        _trusted: bool = False,
+    ):
+        # _trusted=True means the caller has already stripped the fields
+        if not _trusted:
+            title = title.strip()
+            author = author.strip()
+            isbn = isbn.strip()
+        self.title = title
+        self.author = author
+        self.isbn = isbn
+        # cached case-folded title for searching
+        self._title_lower = self.title.casefold()
+        # normalize status; unknown values fall back to available
+        self.status = STATUS_BY_NAME.get(status.lower(), Status.AVAILABLE)
+        # formatted __str__ output, built on first use and reset when the status changes
+        self._repr: str | None = None
 
     def __str__(self) -> str:
-        return (
-            f"Title : {self.title}\n"
-            f"Author: {self.author}\n"
-            f"ISBN  : {self.isbn}\n"
-            f"Status: {self.status.capitalize()}"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"Title : {self.title}\n"
+                f"Author: {self.author}\n"
+                f"ISBN  : {self.isbn}\n"
+                f"Status: {STATUS_LABELS[self.status]}"
+            )
+        return self._repr
 
     def to_dict(self) -> dict:
         """
@@ -42,7 +113,7 @@ class Book:
             "title": self.title,
             "author": self.author,
             "isbn": self.isbn,
-            "status": self.status,
+            "status": STATUS_NAMES[self.status],
         }
 
     @classmethod
@@ -57,14 +128,43 @@ class Book:
             status=data.get("status", "available"),
         )
 
+    @classmethod
+    def _from_trusted_dict(cls, data: dict) -> "Book":
+        """
+        Create a Book from a dictionary previously written by to_dict().
+        Skips the input normalization done in __init__; entries missing a field
+        or with padded values (e.g. hand-edited files) go through from_dict() instead.
+        """
+        try:
+            title = data["title"]
+            author = data["author"]
+            isbn = data["isbn"]
+            status = data["status"]
+        except KeyError:
+            return cls.from_dict(data)
+        if _is_padded(title) or _is_padded(author) or _is_padded(isbn):
+            return cls.from_dict(data)
+        book = object.__new__(cls)
+        book.title = title
+        book.author = author
+        book.isbn = isbn
+        book.status = STATUS_BY_NAME.get(status)
+        if book.status is None:
+            # not written by to_dict(); normalize like __init__ does
+            book.status = STATUS_BY_NAME.get(status.lower(), Status.AVAILABLE)
+        book._title_lower = book.title.casefold()
+        book._repr = None
+        return book
+
     def issue(self) -> bool:
         """
         Mark the book as issued.
         Returns True if successful, False if already issued.
         """
-        if self.status == "issued":
+        if self.status is Status.ISSUED:
             return False
-        self.status = "issued"
+        self.status = Status.ISSUED
+        self._repr = None
         return True
 
     def return_book(self) -> bool:
@@ -72,16 +172,17 @@ class Book:
         Mark the book as available.
         Returns True if successful, False if already available.
         """
-        if self.status == "available":
+        if self.status is Status.AVAILABLE:
             return False
-        self.status = "available"
+        self.status = Status.AVAILABLE
+        self._repr = None
         return True
 
     def is_available(self) -> bool:
         """
         Check if the book is available.
         """
-        return self.status == "available"
+        return self.status is Status.AVAILABLE
 
 
 # -------------------- Library Inventory Class -------------------- #
@@ -93,8 +194,22 @@ class LibraryInventory:
     def __init__(self, data_file: str = "catalog.json"):
         self.data_file = Path(data_file)
         self.books: list[Book] = []
+        self._by_isbn: dict[str, Book] = {}
+        # all case-folded titles joined by NUL, and where each title starts in it;
+        # built on the first title search and discarded when books are added
+        self._title_blob: str | None = None
+        self._title_offsets: list[int] = []
         self.load_from_file()
 
+    def _clear_catalog(self) -> None:
+        """
+        Drop all books and the lookup indexes built over them.
+        """
+        self.books = []
+        self._by_isbn = {}
+        self._title_blob = None
+        self._title_offsets = []
+
     # ---------- File Handling ---------- #
     def load_from_file(self) -> None:
         """
@@ -102,63 +217,218 @@ class LibraryInventory:
         Handles missing or corrupted files using try-except.
         """
         if not self.data_file.exists():
-            logging.info(f"Data file {self.data_file} not found. Starting with empty catalog.")
-            self.books = []
+            logger.info("Data file %s not found. Starting with empty catalog.", self.data_file)
+            self._clear_catalog()
             return
 
         try:
-            with self.data_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.books = [Book.from_dict(item) for item in data]
-            logging.info("Catalog loaded successfully from file.")
-        except json.JSONDecodeError as e:
-            logging.error(f"JSON decode error while loading catalog: {e}")
+            self._clear_catalog()
+            if ijson and not orjson:
+                # without orjson, stream entries straight from the file instead of building
+                # the full list first; orjson's one-shot parse is faster than ijson's streaming
+                with self.data_file.open("rb") as f:
+                    for item in ijson.items(f, "item"):
+                        self._index_book(Book._from_trusted_dict(item))
+            else:
+                for item in self._read_catalog_data():
+                    self._index_book(Book._from_trusted_dict(item))
+            logger.info("Catalog loaded successfully from file.")
+        except JSON_DECODE_ERRORS as e:
+            logger.error("JSON decode error while loading catalog: %s", e)
             print("Warning: Catalog file is corrupted. Starting with an empty catalog.")
-            self.books = []
+            self._clear_catalog()
         except OSError as e:
-            logging.error(f"OS error while loading catalog: {e}")
+            logger.error("OS error while loading catalog: %s", e)
             print("Error reading catalog file. Starting with an empty catalog.")
-            self.books = []
+            self._clear_catalog()
 
-    def save_to_file(self) -> None:
+    def _read_catalog_data(self) -> list:
+        """
+        Parse the whole catalog file. With orjson the file is memory-mapped and
+        parsed in place, avoiding an extra copy of its contents.
+        """
+        if orjson:
+            with self.data_file.open("rb") as f:
+                # empty files cannot be mapped; the json module reports them as corrupted
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        try:
+                            return orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            # orjson is stricter than the json module (e.g. it rejects escaped
+                            # lone surrogates), so let the json module decide
+                            pass
+        return json.loads(self.data_file.read_bytes())
+
+    def save_to_file(self, pretty: bool = False) -> None:
         """
         Save current catalog to JSON file.
+        Output is compact unless pretty=True is given for human-readable indentation.
         """
         try:
-            with self.data_file.open("w", encoding="utf-8") as f:
-                json.dump([book.to_dict() for book in self.books], f, indent=4)
-            logging.info("Catalog saved successfully to file.")
+            data = [book.to_dict() for book in self.books]
+            payload = None
+            if orjson:
+                try:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+                except orjson.JSONEncodeError as e:
+                    # orjson rejects text it cannot encode as UTF-8 (e.g. lone surrogates);
+                    # the stdlib encoder below escapes such characters instead
+                    logger.info("orjson could not encode catalog, using json module: %s", e)
+            if payload is None:
+                # ensure_ascii escapes every non-ASCII character, including lone
+                # surrogates that could not be encoded as UTF-8
+                if pretty:
+                    text = json.dumps(data, indent=2)
+                else:
+                    text = json.dumps(data, separators=(",", ":"))
+                payload = text.encode("ascii")
+            self._write_payload(payload)
+            logger.info("Catalog saved successfully to file.")
         except OSError as e:
-            logging.error(f"OS error while saving catalog: {e}")
+            logger.error("OS error while saving catalog: %s", e)
+            print("Error: Could not save catalog to file.")
+        except (TypeError, ValueError) as e:
+            logger.error("Could not encode catalog while saving: %s", e)
             print("Error: Could not save catalog to file.")
 
+    def _write_payload(self, payload: bytes) -> None:
+        """
+        Write the fully rendered catalog to disk with as few write calls as possible.
+        The data goes to a temporary file that replaces the catalog only once it is
+        flushed, so a crash mid-write never leaves a truncated catalog behind.
+        A symlinked catalog is written through to its target, and an existing
+        catalog's permissions and ownership are carried over to the new file.
+        """
+        target = Path(os.path.realpath(self.data_file))
+        tmp_file = target.with_name(target.name + ".tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                try:
+                    st = os.stat(target)
+                except FileNotFoundError:
+                    pass
+                else:
+                    os.fchmod(fd, stat.S_IMODE(st.st_mode))
+                    if hasattr(os, "fchown"):
+                        try:
+                            os.fchown(fd, st.st_uid, st.st_gid)
+                        except PermissionError:
+                            # only privileged users can give a file away; keep our own ownership
+                            pass
+                view = memoryview(payload)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, target)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
     # ---------- Book Operations ---------- #
-    def add_book(self, book: Book) -> None:
+    def _index_book(self, book: Book) -> None:
         """
-        Add a new book to the catalog.
+        Append a book to the catalog and update the lookup indexes.
         """
-        if self.search_by_isbn(book.isbn):
-            print("A book with this ISBN already exists. Not adding duplicate.")
-            logging.info(f"Attempted to add duplicate ISBN: {book.isbn}")
-            return
         self.books.append(book)
-        logging.info(f"Book added: {book.title} (ISBN: {book.isbn})")
+        # keep the first book for a repeated ISBN, as the original linear scan did
+        self._by_isbn.setdefault(book.isbn, book)
+        self._title_blob = None
+
+    def _build_title_blob(self) -> str:
+        """
+        Return the joined title string used by search_by_title, building it if needed.
+        """
+        if self._title_blob is None:
+            offsets = []
+            position = 0
+            for book in self.books:
+                offsets.append(position)
+                position += len(book._title_lower) + 1
+            self._title_offsets = offsets
+            self._title_blob = "\x00".join(book._title_lower for book in self.books)
+        return self._title_blob
+
+    def add_book(self, book: Book) -> bool:
+        """
+        Add a new book to the catalog.
+        Returns True if added, False if a book with the same ISBN already exists.
+        """
+        if self.reject_duplicate(book.isbn):
+            return False
+        self._index_book(book)
+        logger.info("Book added: %s (ISBN: %s)", book.title, book.isbn)
+        return True
+
+    def add_books(self, books: Iterable[Book]) -> int:
+        """
+        Add several books at once, skipping any whose ISBN is already present.
+        Logs a single summary record for the whole batch.
+        If the iterable raises partway through, the catalog is left unchanged.
+        Returns the number of books added.
+        """
+        new_books = []
+        seen = set()
+        skipped = 0
+        for book in books:
+            if book.isbn in self._by_isbn or book.isbn in seen:
+                skipped += 1
+                continue
+            seen.add(book.isbn)
+            new_books.append(book)
+        for book in new_books:
+            self._index_book(book)
+        logger.info("Added %d books (%d duplicate ISBNs skipped)", len(new_books), skipped)
+        return len(new_books)
 
     def search_by_title(self, title: str) -> list[Book]:
         """
         Return a list of books whose title contains the search string (case-insensitive).
         """
-        title_lower = title.lower()
-        return [book for book in self.books if title_lower in book.title.lower()]
+        title_lower = title.casefold()
+        if not title_lower or "\x00" in title_lower:
+            return [book for book in self.books if title_lower in book._title_lower]
+
+        # search every title with str.find on one joined string, then map each hit
+        # back to its book and resume from the start of the following title
+        blob = self._build_title_blob()
+        offsets = self._title_offsets
+        results = []
+        hit = blob.find(title_lower)
+        while hit != -1:
+            idx = bisect_right(offsets, hit) - 1
+            results.append(self.books[idx])
+            if idx + 1 == len(offsets):
+                break
+            hit = blob.find(title_lower, offsets[idx + 1])
+        return results
+
+    def has_isbn(self, isbn: str) -> bool:
+        """
+        Check whether a book with the exact ISBN is already in the catalog.
+        """
+        return isbn in self._by_isbn
+
+    def reject_duplicate(self, isbn: str) -> bool:
+        """
+        Tell the user and log it if the ISBN is already in the catalog.
+        Returns True if the ISBN is a duplicate and the add should be refused.
+        """
+        if not self.has_isbn(isbn):
+            return False
+        print("A book with this ISBN already exists. Not adding duplicate.")
+        logger.info("Attempted to add duplicate ISBN: %s", isbn)
+        return True
 
     def search_by_isbn(self, isbn: str) -> Book | None:
         """
         Return the book with the exact ISBN, or None if not found.
         """
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
+        return self._by_isbn.get(isbn)
 
     def display_all(self) -> None:
         """
@@ -167,11 +437,13 @@ class LibraryInventory:
         if not self.books:
             print("No books in the catalog.")
             return
-        print("\n--- All Books in Catalog ---")
+        # build the whole listing first so it reaches stdout in a single write
+        lines = ["\n--- All Books in Catalog ---"]
         for idx, book in enumerate(self.books, start=1):
-            print(f"\nBook #{idx}")
-            print(book)
-        print("\n-----------------------------")
+            lines.append(f"\nBook #{idx}")
+            lines.append(str(book))
+        lines.append("\n-----------------------------\n")
+        sys.stdout.write("\n".join(lines))
 
     def issue_book(self, isbn: str) -> None:
         """
@@ -180,15 +452,15 @@ class LibraryInventory:
         book = self.search_by_isbn(isbn)
         if not book:
             print("Book not found.")
-            logging.info(f"Attempt to issue non-existent book ISBN: {isbn}")
+            logger.info("Attempt to issue non-existent book ISBN: %s", isbn)
             return
 
         if book.issue():
             print(f"Book '{book.title}' issued successfully.")
-            logging.info(f"Book issued: {book.title} (ISBN: {book.isbn})")
+            logger.info("Book issued: %s (ISBN: %s)", book.title, book.isbn)
         else:
             print("Book is already issued.")
-            logging.info(f"Attempt to issue already issued book ISBN: {isbn}")
+            logger.info("Attempt to issue already issued book ISBN: %s", isbn)
 
     def return_book(self, isbn: str) -> None:
         """
@@ -197,18 +469,31 @@ class LibraryInventory:
         book = self.search_by_isbn(isbn)
         if not book:
             print("Book not found.")
-            logging.info(f"Attempt to return non-existent book ISBN: {isbn}")
+            logger.info("Attempt to return non-existent book ISBN: %s", isbn)
             return
 
         if book.return_book():
             print(f"Book '{book.title}' returned successfully.")
-            logging.info(f"Book returned: {book.title} (ISBN: {book.isbn})")
+            logger.info("Book returned: %s (ISBN: %s)", book.title, book.isbn)
         else:
             print("Book is already available.")
-            logging.info(f"Attempt to return already available book ISBN: {isbn}")
+            logger.info("Attempt to return already available book ISBN: %s", isbn)
 
 
 # -------------------- CLI Helper Functions -------------------- #
+MAIN_MENU_CHOICES = frozenset(range(1, 7))
+SEARCH_MENU_CHOICES = frozenset({1, 2})
+
+
+def parse_choice(choice_str: str, valid: frozenset[int]) -> int | None:
+    """
+    Convert a menu choice string to an int.
+    Raises ValueError if it is not a number; returns None if it is not one of the valid choices.
+    """
+    choice = int(choice_str)
+    return choice if choice in valid else None
+
+
 def get_non_empty_input(prompt: str) -> str:
     """
     Repeatedly ask the user for input until a non-empty string is given.
@@ -230,12 +515,10 @@ def get_menu_choice() -> int:
     """
     while True:
         try:
-            choice_str = input("Enter your choice: ").strip()
-            choice = int(choice_str)
-            if 1 <= choice <= 6:
+            choice = parse_choice(input("Enter your choice: ").strip(), MAIN_MENU_CHOICES)
+            if choice is not None:
                 return choice
-            else:
-                print("Please enter a number between 1 and 6.")
+            print("Please enter a number between 1 and 6.")
         except ValueError:
             print("Invalid input. Please enter a number (1-6).")
         except (EOFError, KeyboardInterrupt):
@@ -254,10 +537,13 @@ def handle_add_book(inventory: LibraryInventory) -> None:
     isbn = get_non_empty_input("Enter ISBN: ")
     if not isbn:
         return
+    # get_non_empty_input already strips, so duplicates are refused before building the Book
+    if inventory.reject_duplicate(isbn):
+        return
 
-    new_book = Book(title=title, author=author, isbn=isbn)
-    inventory.add_book(new_book)
-    print("Book added to catalog.")
+    new_book = Book(title=title, author=author, isbn=isbn, _trusted=True)
+    if inventory.add_book(new_book):
+        print("Book added to catalog.")
 
 
 def handle_issue_book(inventory: LibraryInventory) -> None:
@@ -286,14 +572,16 @@ def handle_search(inventory: LibraryInventory) -> None:
     print("1. Search by Title")
     print("2. Search by ISBN")
     try:
-        choice_str = input("Enter your choice: ").strip()
-        choice = int(choice_str)
+        choice = parse_choice(input("Enter your choice: ").strip(), SEARCH_MENU_CHOICES)
     except ValueError:
         print("Invalid input. Returning to main menu.")
         return
     except (EOFError, KeyboardInterrupt):
         print("\nInput cancelled. Returning to main menu.")
         return
+    if choice is None:
+        print("Invalid choice. Returning to main menu.")
+        return
 
     if choice == 1:
         title = get_non_empty_input("Enter title or part of title: ")
@@ -316,12 +604,21 @@ def handle_search(inventory: LibraryInventory) -> None:
         else:
             print("\nBook found:")
             print(book)
-    else:
-        print("Invalid choice. Returning to main menu.")
 
 
 # -------------------- Main Menu Loop -------------------- #
+# menu choice -> handler; choice 6 (Save & Exit) is handled by the loop itself
+HANDLERS = {
+    1: handle_add_book,
+    2: handle_issue_book,
+    3: handle_return_book,
+    4: handle_view_all,
+    5: handle_search,
+}
+
+
 def main():
+    setup_logging()
     inventory = LibraryInventory()
 
     print("======================================")
@@ -339,21 +636,12 @@ def main():
 
         choice = get_menu_choice()
 
-        if choice == 1:
-            handle_add_book(inventory)
-        elif choice == 2:
-            handle_issue_book(inventory)
-        elif choice == 3:
-            handle_return_book(inventory)
-        elif choice == 4:
-            handle_view_all(inventory)
-        elif choice == 5:
-            handle_search(inventory)
-        elif choice == 6:
+        if choice == 6:
             print("Saving catalog and exiting...")
             inventory.save_to_file()
             print("Goodbye!")
             break
+        HANDLERS[choice](inventory)
 
 
 if __name__ == "__main__":
@@ -361,5 +649,5 @@ if __name__ == "__main__":
         main()
     except Exception as e:
         # catch any unhandled exception to avoid crashing without a message
-        logging.error(f"Unhandled exception in main: {e}")
+        logger.error("Unhandled exception in main: %s", e)
         print("An unexpected error occurred. Please check the log file for details.")
\ No newline at end of file